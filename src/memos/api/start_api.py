@@ -110,17 +110,15 @@ def get_mos_instance():
         temp_mos.chat_llm = None  # Will be initialized later
         temp_mos.user_manager = UserManagerFactory.from_config(temp_config.user_manager)
 
-        # Create default user if it doesn't exist
-        try:
-            if not temp_mos.user_manager.validate_user(temp_config.user_id):
-                temp_mos.user_manager.create_user(
-                    user_name=temp_config.user_id,
-                    role=UserRole.USER,
-                    user_id=temp_config.user_id,
-                )
-                logger.info(f"Created default user: {temp_config.user_id}")
-        finally:
-            temp_mos.user_manager.close()
+        # Create default user if it doesn't exist. The manager is shared with the MOS
+        # instance below through the factory cache, so it is not closed here.
+        if not temp_mos.user_manager.validate_user(temp_config.user_id):
+            temp_mos.user_manager.create_user(
+                user_name=temp_config.user_id,
+                role=UserRole.USER,
+                user_id=temp_config.user_id,
+            )
+            logger.info(f"Created default user: {temp_config.user_id}")
 
         # Now create the actual MOS instance
         MOS_INSTANCE = MOS(config=temp_config)
@@ -271,17 +269,15 @@ async def set_config(config: MOSConfig):
     # Create a temporary user manager to check/create default user
     temp_user_manager = UserManagerFactory.from_config(config.user_manager)
 
-    # Create default user if it doesn't exist
-    try:
-        if not temp_user_manager.validate_user(config.user_id):
-            temp_user_manager.create_user(
-                user_name=config.user_id,
-                role=UserRole.USER,
-                user_id=config.user_id,
-            )
-            logger.info(f"Created default user: {config.user_id}")
-    finally:
-        temp_user_manager.close()
+    # Create default user if it doesn't exist. The manager is shared with the MOS
+    # instance below through the factory cache, so it is not closed here.
+    if not temp_user_manager.validate_user(config.user_id):
+        temp_user_manager.create_user(
+            user_name=config.user_id,
+            role=UserRole.USER,
+            user_id=config.user_id,
+        )
+        logger.info(f"Created default user: {config.user_id}")
 
     # Now create the MOS instance
     MOS_INSTANCE = MOS(config=config)
@@ -37,7 +37,11 @@ class BaseConfig(BaseModel):
                 f"Schema is set to {self.model_schema}, but it should be {dot_path_schema}. "
                 "Changing schema to the default value."
             )
-        self.model_schema = dot_path_schema
+        if self.model_config.get("frozen"):
+            # Frozen configs reject attribute assignment, so write the field directly
+            object.__setattr__(self, "model_schema", dot_path_schema)
+        else:
+            self.model_schema = dot_path_schema
         return self
 
     @classmethod
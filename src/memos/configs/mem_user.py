@@ -1,12 +1,21 @@
+import functools
+
+from collections.abc import Callable
 from typing import Any, ClassVar
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 from memos.configs.base import BaseConfig
 
 
 class BaseUserManagerConfig(BaseConfig):
-    """Base configuration class for user managers."""
+    """Base configuration class for user managers.
+
+    User manager configs are immutable once validated, which lets identical
+    configurations be cached and shared (see ``_build_user_config``).
+    """
+
+    model_config = ConfigDict(frozen=True, populate_by_name=True)
 
     user_id: str = Field(default="root", description="Default user ID for initialization")
 
@@ -34,8 +43,6 @@ class MySQLUserManagerConfig(BaseUserManagerConfig):
 class PostgresUserManagerConfig(BaseUserManagerConfig):
     """Postgres user manager configuration."""
 
-    model_config = ConfigDict(populate_by_name=True)
-
     host: str = Field(default="localhost", description="Postgres server host")
     port: int = Field(default=5432, description="Postgres server port")
     username: str = Field(default="postgres", description="Postgres username")
@@ -47,15 +54,17 @@ class PostgresUserManagerConfig(BaseUserManagerConfig):
         description="Postgres schema for the user manager",
     )
     sslmode: str | None = Field(default=None, description="Postgres SSL mode")
+    pool_pre_ping: bool = Field(
+        default=True, description="Check pooled connections for liveness on every checkout"
+    )
+    pool_recycle: int = Field(
+        default=-1, description="Seconds after which pooled connections are replaced (-1: never)"
+    )
 
     @property
     def schema(self) -> str:
         return self.schema_
 
-    @schema.setter
-    def schema(self, value: str) -> None:
-        self.schema_ = value
-
 
 class UserManagerConfigFactory(BaseModel):
     """Factory for user manager configurations."""
@@ -71,15 +80,12 @@ class UserManagerConfigFactory(BaseModel):
         "postgres": PostgresUserManagerConfig,
     }
 
-    @field_validator("backend")
-    @classmethod
-    def validate_backend(cls, backend: str) -> str:
-        if backend not in cls.backend_to_class:
-            raise ValueError(f"Unsupported user manager backend: {backend}")
-        return backend
-
     @model_validator(mode="after")
     def instantiate_config(self):
+        config_class = self.backend_to_class.get(self.backend)
+        if config_class is None:
+            raise ValueError(f"Unsupported user manager backend: {self.backend}")
+
         config_dict = dict(self.config)
 
         port_value = config_dict.get("port")
@@ -89,6 +95,54 @@ class UserManagerConfigFactory(BaseModel):
             with suppress(ValueError):
                 config_dict["port"] = int(port_value)
 
-        config_class = self.backend_to_class[self.backend]
-        self.config = config_class(**config_dict)
+        try:
+            # The value type is part of the key: 3307 == 3307.0 and 1 == True would
+            # otherwise share an entry, though strict validation treats them differently
+            key = frozenset((k, type(v), v) for k, v in config_dict.items())
+            self.config = _build_user_config(self.backend, key)
+        except TypeError:
+            # Unhashable values cannot be used as a cache key
+            self.config = config_class(**config_dict)
         return self
+
+
+@functools.lru_cache(maxsize=128)
+def _build_user_config(
+    backend: str, items: frozenset[tuple[str, type, Any]]
+) -> BaseUserManagerConfig:
+    """Validate a user manager config once and reuse it for identical inputs."""
+    config_class = UserManagerConfigFactory.backend_to_class[backend]
+    return config_class(**{k: v for k, _, v in items})
+
+
+def _make_kwargs_dumper(
+    config_class: type[BaseUserManagerConfig],
+) -> Callable[[BaseUserManagerConfig], dict[str, Any]]:
+    fields = tuple(
+        (name, info.alias or name)
+        for name, info in config_class.model_fields.items()
+        if not info.exclude
+    )
+
+    def dump(config: BaseUserManagerConfig) -> dict[str, Any]:
+        return {alias: getattr(config, name) for name, alias in fields}
+
+    return dump
+
+
+_KWARGS_DUMPERS = {
+    config_class: _make_kwargs_dumper(config_class)
+    for config_class in UserManagerConfigFactory.backend_to_class.values()
+}
+
+
+def dump_user_config(config: BaseModel) -> dict[str, Any]:
+    """Return a user manager config as constructor kwargs.
+
+    Equivalent to ``config.model_dump(by_alias=True)`` for the registered config
+    classes, but reads the fields directly instead of running the serializer.
+    """
+    dumper = _KWARGS_DUMPERS.get(type(config))
+    if dumper is None:
+        return config.model_dump(by_alias=True)
+    return dumper(config)
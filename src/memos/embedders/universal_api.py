@@ -1,13 +1,104 @@
+import asyncio
+import base64
+import functools
 import os
+import threading
 
+import httpx
+import numpy as np
+
+from openai import AsyncAzureOpenAI as AsyncAzureClient
+from openai import AsyncOpenAI as AsyncOpenAIClient
 from openai import AzureOpenAI as AzureClient
+from openai import DefaultAsyncHttpxClient
 from openai import OpenAI as OpenAIClient
 
 from memos.configs.embedder import UniversalAPIEmbedderConfig
 from memos.embedders.base import BaseEmbedder
+from memos.llms.openai import (
+    _HTTP2_AVAILABLE,
+    _HTTP_LIMITS,
+    _is_model_missing,
+    _new_shared_http_client,
+)
 from memos.log import get_logger
 
 
+# Embedding model to retry with when the configured one does not exist
+_EMBED_FALLBACK_MODEL = os.getenv("MOS_EMBED_FALLBACK_MODEL", "text-embedding-3-large").strip()
+
+# Azure OpenAI API version used by both the sync and async clients
+_AZURE_API_VERSION = "2024-03-01-preview"
+
+# Maximum number of texts sent in a single request by the async embedding path
+_ASYNC_EMBED_CHUNK_SIZE = 96
+
+# Embedding traffic gets its own pool so large batches cannot starve chat completions
+_shared_http_client: httpx.Client | None = None
+_shared_http_client_lock = threading.Lock()
+
+
+def _get_shared_http_client() -> httpx.Client:
+    """Return the process-wide httpx client that backs every embedding API client."""
+    global _shared_http_client
+    if _shared_http_client is None:
+        with _shared_http_client_lock:
+            # Double-check pattern to prevent race conditions
+            if _shared_http_client is None:
+                _shared_http_client = _new_shared_http_client()
+    return _shared_http_client
+
+
+@functools.lru_cache(maxsize=32)
+def _get_universal_openai(api_key: str, base_url: str | None) -> OpenAIClient:
+    """Return a process-wide OpenAI client shared by all embedders with the same credentials."""
+    return OpenAIClient(api_key=api_key, base_url=base_url, http_client=_get_shared_http_client())
+
+
+@functools.lru_cache(maxsize=32)
+def _get_universal_azure(endpoint: str | None, api_version: str, api_key: str) -> AzureClient:
+    """Return a process-wide Azure client shared by all embedders with the same credentials."""
+    return AzureClient(
+        azure_endpoint=endpoint,
+        api_version=api_version,
+        api_key=api_key,
+        http_client=_get_shared_http_client(),
+    )
+
+
+def _decode_embedding(embedding: str | list[float]) -> np.ndarray:
+    # OpenAI-compatible servers that ignore encoding_format still return plain float lists
+    if isinstance(embedding, str):
+        return np.frombuffer(base64.b64decode(embedding), dtype=np.float32)
+    return np.asarray(embedding, dtype=np.float32)
+
+
+def _embeddings_to_lists(data) -> list[list[float]]:
+    """Return embedding API results as float lists, decoding only base64 rows.
+
+    Float lists from servers that ignore encoding_format are passed through untouched,
+    so their float64 values are not rounded to float32.
+    """
+    return [
+        _decode_embedding(item.embedding).tolist()
+        if isinstance(item.embedding, str)
+        else item.embedding
+        for item in data
+    ]
+
+
+def _embeddings_to_array(data) -> np.ndarray:
+    """Stack embedding API results into a preallocated float32 matrix."""
+    if not data:
+        return np.empty((0, 0), dtype=np.float32)
+    first = _decode_embedding(data[0].embedding)
+    matrix = np.empty((len(data), first.shape[0]), dtype=np.float32)
+    matrix[0] = first
+    for i, item in enumerate(data[1:], start=1):
+        matrix[i] = _decode_embedding(item.embedding)
+    return matrix
+
+
 class UniversalAPIEmbedder(BaseEmbedder):
     def __init__(self, config: UniversalAPIEmbedderConfig):
         self.provider = config.provider
@@ -15,42 +106,125 @@ class UniversalAPIEmbedder(BaseEmbedder):
         self.logger = get_logger(__name__)
 
         if self.provider == "openai":
-            self.client = OpenAIClient(api_key=config.api_key, base_url=config.base_url)
+            self.client = _get_universal_openai(config.api_key, config.base_url)
         elif self.provider == "azure":
-            self.client = AzureClient(
-                azure_endpoint=config.base_url,
-                api_version="2024-03-01-preview",
-                api_key=config.api_key,
-            )
+            self.client = _get_universal_azure(config.base_url, _AZURE_API_VERSION, config.api_key)
         else:
             raise ValueError(f"Unsupported provider: {self.provider}")
 
+        # Resolve the model name once instead of on every request
+        self._model_name = (config.model_name_or_path or "text-embedding-3-large").strip()
+
+        # Async clients are created on first use, one per event loop (see _get_async_client)
+        self._aclients: dict[asyncio.AbstractEventLoop, AsyncOpenAIClient | AsyncAzureClient] = {}
+
+    def _new_async_client(self) -> AsyncOpenAIClient | AsyncAzureClient:
+        """Create an async client for the configured provider.
+
+        Async connection pools are bound to the event loop that first uses them,
+        so these clients are not shared through the process-wide caches. Each one
+        gets its own pool with the same limits as the shared sync pool.
+        """
+        http_client = DefaultAsyncHttpxClient(http2=_HTTP2_AVAILABLE, limits=_HTTP_LIMITS)
+        if self.provider == "azure":
+            return AsyncAzureClient(
+                azure_endpoint=self.config.base_url,
+                api_version=_AZURE_API_VERSION,
+                api_key=self.config.api_key,
+                http_client=http_client,
+            )
+        return AsyncOpenAIClient(
+            api_key=self.config.api_key, base_url=self.config.base_url, http_client=http_client
+        )
+
+    def _get_async_client(self) -> AsyncOpenAIClient | AsyncAzureClient:
+        """Return this embedder's async client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        aclient = self._aclients.get(loop)
+        if aclient is None:
+            # Drop clients of loops that have closed; their connections died with the loop
+            self._aclients = {
+                other: client for other, client in self._aclients.items() if not other.is_closed()
+            }
+            aclient = self._aclients[loop] = self._new_async_client()
+        return aclient
+
+    def _fallback_model(self, error: Exception) -> str:
+        """Log the switch to the fallback embedding model and return its name."""
+        self.logger.warning(
+            f"Embedding model '{self._model_name}' not available. Falling back to '{_EMBED_FALLBACK_MODEL}'. Error: {error!s}"
+        )
+        return _EMBED_FALLBACK_MODEL
+
+    def _create_embeddings(self, texts: list[str], **kwargs):
+        """Call the embeddings endpoint, retrying on the fallback model if ours is missing."""
+        try:
+            return self.client.embeddings.create(model=self._model_name, input=texts, **kwargs)
+        except Exception as e:
+            if not _is_model_missing(e):
+                raise
+            fallback_model = self._fallback_model(e)
+        return self.client.embeddings.create(model=fallback_model, input=texts, **kwargs)
+
     def embed(self, texts: list[str]) -> list[list[float]]:
         if self.provider == "openai" or self.provider == "azure":
-            model_name = getattr(self.config, "model_name_or_path", "text-embedding-3-large")
-            if isinstance(model_name, str):
-                model_name = model_name.strip()
-            try:
-                response = self.client.embeddings.create(
-                    model=model_name,
-                    input=texts,
-                )
-            except Exception as e:
-                msg = str(e).lower()
-                if ("invalid model" in msg) or ("model_not_found" in msg):
-                    # Fallback to a safe default embedding model
-                    fallback_model = os.getenv(
-                        "MOS_EMBED_FALLBACK_MODEL", "text-embedding-3-large"
-                    ).strip()
-                    self.logger.warning(
-                        f"Embedding model '{model_name}' not available. Falling back to '{fallback_model}'. Error: {e!s}"
-                    )
-                    response = self.client.embeddings.create(
-                        model=fallback_model,
-                        input=texts,
-                    )
-                else:
-                    raise
-            return [r.embedding for r in response.data]
+            response = self._create_embeddings(texts, encoding_format="base64")
+            return _embeddings_to_lists(response.data)
         else:
             raise ValueError(f"Unsupported provider: {self.provider}")
+
+    def embed_np(self, texts: list[str]) -> np.ndarray:
+        """Embed texts into a ``(len(texts), dims)`` float32 matrix.
+
+        Vectors are decoded straight into the matrix, skipping the per-float
+        Python objects that ``embed`` has to build for its list return type.
+        """
+        response = self._create_embeddings(texts, encoding_format="base64")
+        return _embeddings_to_array(response.data)
+
+    async def _aembed_chunk(
+        self, aclient: AsyncOpenAIClient | AsyncAzureClient, texts: list[str]
+    ) -> list[list[float]]:
+        try:
+            response = await aclient.embeddings.create(
+                model=self._model_name, input=texts, encoding_format="base64"
+            )
+        except Exception as e:
+            if not _is_model_missing(e):
+                raise
+            response = await aclient.embeddings.create(
+                model=self._fallback_model(e), input=texts, encoding_format="base64"
+            )
+        return _embeddings_to_lists(response.data)
+
+    async def _aembed(
+        self, aclient: AsyncOpenAIClient | AsyncAzureClient, texts: list[str]
+    ) -> list[list[float]]:
+        chunks = [
+            texts[i : i + _ASYNC_EMBED_CHUNK_SIZE]
+            for i in range(0, len(texts), _ASYNC_EMBED_CHUNK_SIZE)
+        ]
+        results = await asyncio.gather(*(self._aembed_chunk(aclient, c) for c in chunks))
+        return [embedding for result in results for embedding in result]
+
+    async def aembed(self, texts: list[str]) -> list[list[float]]:
+        """Embed texts asynchronously, sending sub-batches as concurrent requests.
+
+        Embeddings are returned in the same order as ``texts``.
+        """
+        return await self._aembed(self._get_async_client(), texts)
+
+    def embed_many(self, batches: list[list[str]]) -> list[list[list[float]]]:
+        """Embed several batches of texts concurrently from synchronous code.
+
+        Must not be called from inside a running event loop; use ``aembed`` there.
+        Each call runs its own event loop and so opens (and closes) a fresh async
+        connection pool; callers embedding repeatedly should prefer ``aembed``.
+        """
+
+        async def _run() -> list[list[list[float]]]:
+            # A fresh client per event loop keeps pooled connections on the loop that owns them
+            async with self._new_async_client() as aclient:
+                return await asyncio.gather(*(self._aembed(aclient, b) for b in batches))
+
+        return asyncio.run(_run())
@@ -1,3 +1,5 @@
+import logging
+
 from collections.abc import Generator
 
 from memos.configs.llm import DeepSeekLLMConfig
@@ -18,7 +20,7 @@ class DeepSeekLLM(OpenAILLM):
 
     def generate(self, messages: MessageList) -> str:
         """Generate a response from DeepSeek."""
-        response = self.client.chat.completions.create(
+        response = self._chat_create(
             model=self.config.model_name_or_path,
             messages=messages,
             temperature=self.config.temperature,
@@ -26,7 +28,8 @@ class DeepSeekLLM(OpenAILLM):
             top_p=self.config.top_p,
             extra_body=self.config.extra_body,
         )
-        logger.info(f"Response from DeepSeek: {response.model_dump_json()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Response from DeepSeek: %s", response.model_dump_json())
         response_content = response.choices[0].message.content
         if self.config.remove_think_prefix:
             return remove_thinking_tags(response_content)
@@ -35,7 +38,7 @@ class DeepSeekLLM(OpenAILLM):
 
     def generate_stream(self, messages: MessageList, **kwargs) -> Generator[str, None, None]:
         """Stream response from DeepSeek."""
-        response = self.client.chat.completions.create(
+        response = self._chat_create(
             model=self.config.model_name_or_path,
             messages=messages,
             stream=True,
@@ -47,8 +50,10 @@ class DeepSeekLLM(OpenAILLM):
         # Streaming chunks of text
         for chunk in response:
             delta = chunk.choices[0].delta
-            if hasattr(delta, "reasoning_content") and delta.reasoning_content:
-                yield delta.reasoning_content
+            reasoning_content = getattr(delta, "reasoning_content", None)
+            if reasoning_content:
+                yield reasoning_content
 
-            if hasattr(delta, "content") and delta.content:
-                yield delta.content
+            content = getattr(delta, "content", None)
+            if content:
+                yield content
@@ -1,7 +1,14 @@
+import functools
+import importlib.util
+import logging
 import os
+import re
+import threading
 
 from collections.abc import Generator
+from typing import Any
 
+import httpx
 import openai
 
 from memos.configs.llm import AzureLLMConfig, OpenAILLMConfig
@@ -13,6 +20,65 @@ from memos.types import MessageList
 
 logger = get_logger(__name__)
 
+# HTTP/2 is opt-in: `h2` is not a MemOS dependency, so it is only used after
+# `pip install httpx[http2]`. Default installs speak HTTP/1.1 over the same tuned pool.
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+_HTTP_LIMITS = httpx.Limits(
+    max_connections=200, max_keepalive_connections=100, keepalive_expiry=300
+)
+
+# Read once at import; memos.log has already loaded .env by this point
+_FALLBACK_MODEL = os.getenv("MOS_FALLBACK_MODEL", "gpt-4o-mini").strip()
+
+# Matches provider errors that mean the requested model does not exist
+_MODEL_MISSING_RE = re.compile(r"invalid model|model_not_found", re.IGNORECASE)
+
+_shared_http_client: httpx.Client | None = None
+_shared_http_client_lock = threading.Lock()
+
+
+def _new_shared_http_client() -> httpx.Client:
+    """Create a pooled httpx client meant to be shared by many OpenAI-compatible clients."""
+    return openai.DefaultHttpxClient(http2=_HTTP2_AVAILABLE, limits=_HTTP_LIMITS)
+
+
+def _get_shared_http_client() -> httpx.Client:
+    """Return the process-wide httpx client that backs every OpenAI/Azure LLM client."""
+    global _shared_http_client
+    if _shared_http_client is None:
+        with _shared_http_client_lock:
+            # Double-check pattern to prevent race conditions
+            if _shared_http_client is None:
+                _shared_http_client = _new_shared_http_client()
+    return _shared_http_client
+
+
+def _is_model_missing(exc: Exception) -> bool:
+    """Return True if the exception says the requested model is unavailable."""
+    return _MODEL_MISSING_RE.search(str(exc)) is not None
+
+
+def _messages_to_text(messages: MessageList) -> str:
+    """Flatten chat messages into the plain-text input expected by the Responses API."""
+    return "\n".join(f"{m['role']}: {m['content']}" for m in messages)
+
+
+@functools.lru_cache(maxsize=32)
+def _get_openai_client(api_key: str, base_url: str) -> openai.Client:
+    """Return a process-wide OpenAI client shared by all LLMs with the same credentials."""
+    return openai.Client(api_key=api_key, base_url=base_url, http_client=_get_shared_http_client())
+
+
+@functools.lru_cache(maxsize=32)
+def _get_azure_client(endpoint: str, api_version: str, api_key: str) -> openai.AzureOpenAI:
+    """Return a process-wide Azure OpenAI client shared by all LLMs with the same credentials."""
+    return openai.AzureOpenAI(
+        azure_endpoint=endpoint,
+        api_version=api_version,
+        api_key=api_key,
+        http_client=_get_shared_http_client(),
+    )
+
 
 class OpenAILLM(BaseLLM):
     """OpenAI LLM class."""
@@ -25,57 +91,81 @@ class OpenAILLM(BaseLLM):
                 self.config.model_name_or_path = self.config.model_name_or_path.strip()
         except Exception:
             pass
-        self.client = openai.Client(api_key=config.api_key, base_url=config.api_base)
+        self.client = _get_openai_client(config.api_key, config.api_base)
+        # Bind once so each request skips the client.chat.completions attribute chain
+        self._chat_create = self.client.chat.completions.create
 
-    def generate(self, messages: MessageList) -> str:
-        """Generate a response from OpenAI LLM."""
-        model_name = self.config.model_name_or_path
-        is_gpt5_family = model_name.startswith("gpt-5")
-        # Build kwargs conditionally to support gpt-5* models requiring max_completion_tokens
+        # Resolve per-model request kwargs once instead of on every call
+        self._is_gpt5 = self.config.model_name_or_path.startswith("gpt-5")
+        # gpt-5 models take max_completion_tokens; fall back to max_tokens when it is unset.
+        # Subclass configs (Qwen, DeepSeek) do not declare the field at all.
+        self._max_comp_tokens = getattr(self.config, "max_completion_tokens", None)
+        if self._max_comp_tokens is None:
+            self._max_comp_tokens = self.config.max_tokens
+        self._base_generate_kwargs = self._build_create_kwargs(stream=False)
+        self._base_stream_kwargs = self._build_create_kwargs(stream=True)
+
+    def _build_create_kwargs(self, stream: bool) -> dict[str, Any]:
+        """Build the static part of the chat completion kwargs (everything except messages)."""
         create_kwargs = {
-            "model": model_name,
-            "messages": messages,
+            "model": self.config.model_name_or_path,
             "extra_body": self.config.extra_body,
             "temperature": self.config.temperature,
-            "top_p": self.config.top_p,
         }
+        if stream:
+            create_kwargs["stream"] = True
+
         # GPT-5 models: enforce API constraints (no top_p/logprobs; temperature must be 1)
-        if is_gpt5_family:
+        if self._is_gpt5:
             create_kwargs["temperature"] = 1
-            if "top_p" in create_kwargs:
-                create_kwargs.pop("top_p")
-            # Sanitize extra_body for unsupported sampling/logprob fields
-            if isinstance(create_kwargs.get("extra_body"), dict):
-                for k in ["top_p", "top_logprobs", "logprobs", "logit_bias"]:
-                    create_kwargs["extra_body"].pop(k, None)
-        if is_gpt5_family:
-            # Use explicit max_completion_tokens if provided; otherwise fallback to max_tokens
-            max_comp = getattr(self.config, "max_completion_tokens", None)
-            if max_comp is None:
-                max_comp = getattr(self.config, "max_tokens", None)
-            if max_comp is not None:
-                create_kwargs["max_completion_tokens"] = max_comp
+            # Sanitize a copy of extra_body so the config itself is left untouched
+            if isinstance(self.config.extra_body, dict):
+                create_kwargs["extra_body"] = {
+                    k: v
+                    for k, v in self.config.extra_body.items()
+                    if k not in ("top_p", "top_logprobs", "logprobs", "logit_bias")
+                }
+            create_kwargs["max_completion_tokens"] = self._max_comp_tokens
         else:
             create_kwargs["max_tokens"] = self.config.max_tokens
-            create_kwargs["top_p"] = self.config.top_p
+            if not stream:
+                create_kwargs["top_p"] = self.config.top_p
+        return create_kwargs
+
+    def _build_fallback_kwargs(
+        self, fallback_model: str, messages: MessageList, stream: bool = False
+    ) -> dict[str, Any]:
+        """Build chat completion kwargs for retrying on the fallback model."""
+        fallback_kwargs = {
+            "model": fallback_model,
+            "messages": messages,
+            "extra_body": self.config.extra_body,
+            "temperature": self.config.temperature,
+            "max_tokens": self.config.max_tokens,
+        }
+        if stream:
+            fallback_kwargs["stream"] = True
+        return fallback_kwargs
+
+    def generate(self, messages: MessageList) -> str:
+        """Generate a response from OpenAI LLM."""
+        model_name = self.config.model_name_or_path
+        is_gpt5_family = self._is_gpt5
+        create_kwargs = self._base_generate_kwargs.copy()
+        create_kwargs["messages"] = messages
 
         try:
-            response = self.client.chat.completions.create(**create_kwargs)
+            response = self._chat_create(**create_kwargs)
         except Exception as e:  # Fallbacks on invalid model / unsupported endpoint
-            msg = str(e).lower()
-            if ("invalid model" in msg or "model_not_found" in msg) and is_gpt5_family:
+            if not _is_model_missing(e):
+                raise
+            if is_gpt5_family:
                 # Try Responses API for gpt-5 family
                 try:
-                    max_comp = getattr(self.config, "max_completion_tokens", None) or getattr(
-                        self.config, "max_tokens", None
-                    )
-                    text_input = "\n".join(
-                        [f"{m.get('role')}: {m.get('content')}" for m in messages]
-                    )
                     resp = self.client.responses.create(
                         model=model_name,
-                        input=text_input,
-                        max_output_tokens=max_comp,
+                        input=_messages_to_text(messages),
+                        max_output_tokens=self._max_comp_tokens,
                     )
                     response_content = getattr(resp, "output_text", None) or (
                         resp.output[0].content[0].text if getattr(resp, "output", None) else ""
@@ -86,39 +176,14 @@ class OpenAILLM(BaseLLM):
                 except Exception as e2:
                     # Then try explicit fallback model
                     logger.warning(f"Responses API fallback failed for '{model_name}': {e2!s}")
-                # explicit fallback to configured fallback model
-                fallback_model = os.getenv("MOS_FALLBACK_MODEL", "gpt-4o-mini").strip()
-                logger.warning(
-                    f"Model '{model_name}' not available. Falling back to '{fallback_model}'. Error: {e!s}"
-                )
-                fallback_kwargs = {
-                    "model": fallback_model,
-                    "messages": messages,
-                    "extra_body": self.config.extra_body,
-                    "temperature": self.config.temperature,
-                    "max_tokens": self.config.max_tokens,
-                }
-                response = self.client.chat.completions.create(**fallback_kwargs)
-            elif "invalid model" in msg or "model_not_found" in msg:
-                fallback_model = os.getenv("MOS_FALLBACK_MODEL", "gpt-4o-mini")
-                logger.warning(
-                    f"Model '{model_name}' not available. Falling back to '{fallback_model}'. Error: {e!s}"
-                )
-                # Reset kwargs for non-gpt5 model
-                fallback_kwargs = {
-                    "model": fallback_model,
-                    "messages": messages,
-                    "extra_body": self.config.extra_body,
-                    "temperature": self.config.temperature,
-                    "max_tokens": self.config.max_tokens,
-                }
-                try:
-                    response = self.client.chat.completions.create(**fallback_kwargs)
-                except Exception:
-                    raise
-            else:
-                raise
-        logger.info(f"Response from OpenAI: {response.model_dump_json()}")
+            # explicit fallback to configured fallback model
+            fallback_model = _FALLBACK_MODEL
+            logger.warning(
+                f"Model '{model_name}' not available. Falling back to '{fallback_model}'. Error: {e!s}"
+            )
+            response = self._chat_create(**self._build_fallback_kwargs(fallback_model, messages))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Response from OpenAI: %s", response.model_dump_json())
         response_content = response.choices[0].message.content
         if self.config.remove_think_prefix:
             return remove_thinking_tags(response_content)
@@ -128,52 +193,22 @@ class OpenAILLM(BaseLLM):
     def generate_stream(self, messages: MessageList, **kwargs) -> Generator[str, None, None]:
         """Stream response from OpenAI LLM with optional reasoning support."""
         model_name = self.config.model_name_or_path
-        is_gpt5_family = model_name.startswith("gpt-5")
-
-        # Build kwargs conditionally to support gpt-5* models requiring max_completion_tokens
-        create_kwargs = {
-            "model": model_name,
-            "messages": messages,
-            "stream": True,
-            "extra_body": self.config.extra_body,
-            "temperature": self.config.temperature,
-        }
-
-        # GPT-5 models: enforce API constraints (no top_p/logprobs; temperature must be 1)
-        if is_gpt5_family:
-            create_kwargs["temperature"] = 1
-            # Remove unsupported sampling fields
-            if "top_p" in create_kwargs:
-                create_kwargs.pop("top_p")
-            if isinstance(create_kwargs.get("extra_body"), dict):
-                for k in ["top_p", "top_logprobs", "logprobs", "logit_bias"]:
-                    create_kwargs["extra_body"].pop(k, None)
-            # Use explicit max_completion_tokens if provided; otherwise fallback to max_tokens
-            max_comp = getattr(self.config, "max_completion_tokens", None)
-            if max_comp is None:
-                max_comp = getattr(self.config, "max_tokens", None)
-            if max_comp is not None:
-                create_kwargs["max_completion_tokens"] = max_comp
-        else:
-            create_kwargs["max_tokens"] = self.config.max_tokens
+        is_gpt5_family = self._is_gpt5
+        create_kwargs = self._base_stream_kwargs.copy()
+        create_kwargs["messages"] = messages
 
         try:
-            response = self.client.chat.completions.create(**create_kwargs)
+            response = self._chat_create(**create_kwargs)
         except Exception as e:
-            msg = str(e).lower()
-            if ("invalid model" in msg or "model_not_found" in msg) and is_gpt5_family:
+            if not _is_model_missing(e):
+                raise
+            if is_gpt5_family:
                 # Non-stream fallback using Responses API (emit once)
                 try:
-                    max_comp = getattr(self.config, "max_completion_tokens", None) or getattr(
-                        self.config, "max_tokens", None
-                    )
-                    text_input = "\n".join(
-                        [f"{m.get('role')}: {m.get('content')}" for m in messages]
-                    )
                     resp = self.client.responses.create(
                         model=model_name,
-                        input=text_input,
-                        max_output_tokens=max_comp,
+                        input=_messages_to_text(messages),
+                        max_output_tokens=self._max_comp_tokens,
                     )
                     response_content = getattr(resp, "output_text", None) or (
                         resp.output[0].content[0].text if getattr(resp, "output", None) else ""
@@ -185,36 +220,14 @@ class OpenAILLM(BaseLLM):
                     logger.warning(
                         f"Responses API streaming fallback failed for '{model_name}': {e2!s}"
                     )
-                # Fall back to non-stream on fallback model
-                fallback_model = os.getenv("MOS_FALLBACK_MODEL", "gpt-4o-mini").strip()
-                logger.warning(
-                    f"Model '{model_name}' not available for streaming. Falling back to '{fallback_model}'. Error: {e!s}"
-                )
-                fallback_kwargs = {
-                    "model": fallback_model,
-                    "messages": messages,
-                    "stream": True,
-                    "extra_body": self.config.extra_body,
-                    "temperature": self.config.temperature,
-                    "max_tokens": self.config.max_tokens,
-                }
-                response = self.client.chat.completions.create(**fallback_kwargs)
-            elif "invalid model" in msg or "model_not_found" in msg:
-                fallback_model = os.getenv("MOS_FALLBACK_MODEL", "gpt-4o-mini")
-                logger.warning(
-                    f"Model '{model_name}' not available for streaming. Falling back to '{fallback_model}'. Error: {e!s}"
-                )
-                fallback_kwargs = {
-                    "model": fallback_model,
-                    "messages": messages,
-                    "stream": True,
-                    "extra_body": self.config.extra_body,
-                    "temperature": self.config.temperature,
-                    "max_tokens": self.config.max_tokens,
-                }
-                response = self.client.chat.completions.create(**fallback_kwargs)
-            else:
-                raise
+            # Fall back to the configured fallback model
+            fallback_model = _FALLBACK_MODEL
+            logger.warning(
+                f"Model '{model_name}' not available for streaming. Falling back to '{fallback_model}'. Error: {e!s}"
+            )
+            response = self._chat_create(
+                **self._build_fallback_kwargs(fallback_model, messages, stream=True)
+            )
 
         reasoning_started = False
 
@@ -222,16 +235,22 @@ class OpenAILLM(BaseLLM):
             delta = chunk.choices[0].delta
 
             # Support for custom 'reasoning_content' (if present in OpenAI-compatible models like Qwen)
-            if hasattr(delta, "reasoning_content") and delta.reasoning_content:
+            reasoning_content = getattr(delta, "reasoning_content", None)
+            # Tags are glued onto the adjacent chunk so each transition costs one yield
+            if reasoning_content:
                 if not reasoning_started and not self.config.remove_think_prefix:
-                    yield "<think>"
                     reasoning_started = True
-                yield delta.reasoning_content
-            elif hasattr(delta, "content") and delta.content:
+                    yield "<think>" + reasoning_content
+                else:
+                    yield reasoning_content
+                continue
+            content = getattr(delta, "content", None)
+            if content:
                 if reasoning_started and not self.config.remove_think_prefix:
-                    yield "</think>"
                     reasoning_started = False
-                yield delta.content
+                    yield "</think>" + content
+                else:
+                    yield content
 
         # Ensure we close the <think> block if not already done
         if reasoning_started and not self.config.remove_think_prefix:
@@ -243,22 +262,20 @@ class AzureLLM(BaseLLM):
 
     def __init__(self, config: AzureLLMConfig):
         self.config = config
-        self.client = openai.AzureOpenAI(
-            azure_endpoint=config.base_url,
-            api_version=config.api_version,
-            api_key=config.api_key,
-        )
+        self.client = _get_azure_client(config.base_url, config.api_version, config.api_key)
+        self._chat_create = self.client.chat.completions.create
 
     def generate(self, messages: MessageList) -> str:
         """Generate a response from Azure OpenAI LLM."""
-        response = self.client.chat.completions.create(
+        response = self._chat_create(
             model=self.config.model_name_or_path,
             messages=messages,
             temperature=self.config.temperature,
             max_tokens=self.config.max_tokens,
             top_p=self.config.top_p,
         )
-        logger.info(f"Response from Azure OpenAI: {response.model_dump_json()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Response from Azure OpenAI: %s", response.model_dump_json())
         response_content = response.choices[0].message.content
         if self.config.remove_think_prefix:
             return remove_thinking_tags(response_content)
@@ -1,3 +1,5 @@
+import logging
+
 from collections.abc import Generator
 
 from memos.configs.llm import QwenLLMConfig
@@ -18,7 +20,7 @@ class QwenLLM(OpenAILLM):
 
     def generate(self, messages: MessageList) -> str:
         """Generate a response from Qwen LLM."""
-        response = self.client.chat.completions.create(
+        response = self._chat_create(
             model=self.config.model_name_or_path,
             messages=messages,
             extra_body=self.config.extra_body,
@@ -26,7 +28,8 @@ class QwenLLM(OpenAILLM):
             max_tokens=self.config.max_tokens,
             top_p=self.config.top_p,
         )
-        logger.info(f"Response from Qwen: {response.model_dump_json()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Response from Qwen: %s", response.model_dump_json())
         response_content = response.choices[0].message.content
         if self.config.remove_think_prefix:
             return remove_thinking_tags(response_content)
@@ -35,7 +38,7 @@ class QwenLLM(OpenAILLM):
 
     def generate_stream(self, messages: MessageList, **kwargs) -> Generator[str, None, None]:
         """Stream response from Qwen LLM."""
-        response = self.client.chat.completions.create(
+        response = self._chat_create(
             model=self.config.model_name_or_path,
             messages=messages,
             stream=True,
@@ -51,13 +54,19 @@ class QwenLLM(OpenAILLM):
 
             # Some models may have separate `reasoning_content` vs `content`
             # For Qwen (DashScope), likely only `content` is used
-            if hasattr(delta, "reasoning_content") and delta.reasoning_content:
+            reasoning_content = getattr(delta, "reasoning_content", None)
+            # Tags are glued onto the adjacent chunk so each transition costs one yield
+            if reasoning_content:
                 if not reasoning_started and not self.config.remove_think_prefix:
-                    yield "<think>"
                     reasoning_started = True
-                yield delta.reasoning_content
-            elif hasattr(delta, "content") and delta.content:
+                    yield "<think>" + reasoning_content
+                else:
+                    yield reasoning_content
+                continue
+            content = getattr(delta, "content", None)
+            if content:
                 if reasoning_started and not self.config.remove_think_prefix:
-                    yield "</think>"
                     reasoning_started = False
-                yield delta.content
+                    yield "</think>" + content
+                else:
+                    yield content
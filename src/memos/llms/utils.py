@@ -1,6 +1,9 @@
 import re
 
 
+_THINK_PREFIX_RE = re.compile(r"^<think>.*?</think>\s*", flags=re.DOTALL)
+
+
 def remove_thinking_tags(text: str) -> str:
     """
     Remove thinking tags from the generated text.
@@ -11,4 +14,7 @@ def remove_thinking_tags(text: str) -> str:
     Returns:
         str: The cleaned text.
     """
-    return re.sub(r"^<think>.*?</think>\s*", "", text, flags=re.DOTALL).strip()
+    # The pattern is anchored at the start, so skip the regex when there is no leading tag
+    if not text.startswith("<think>"):
+        return text.strip()
+    return _THINK_PREFIX_RE.sub("", text).strip()
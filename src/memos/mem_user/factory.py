@@ -1,8 +1,13 @@
+import functools
 import os
+import threading
+import types
 
+from collections import OrderedDict
+from collections.abc import Mapping
 from typing import Any, ClassVar
 
-from memos.configs.mem_user import UserManagerConfigFactory
+from memos.configs.mem_user import UserManagerConfigFactory, dump_user_config
 from memos.mem_user.mysql_user_manager import MySQLUserManager
 from memos.mem_user.postgres_user_manager import PostgresUserManager
 from memos.mem_user.user_manager import UserManager
@@ -11,11 +16,21 @@ from memos.mem_user.user_manager import UserManager
 class UserManagerFactory:
     """Factory class for creating user manager instances."""
 
-    backend_to_class: ClassVar[dict[str, Any]] = {
-        "sqlite": UserManager,
-        "mysql": MySQLUserManager,
-        "postgres": PostgresUserManager,
-    }
+    # Read-only so the registry cannot drift from _BACKENDS at runtime
+    backend_to_class: ClassVar[Mapping[str, Any]] = types.MappingProxyType(
+        {
+            "sqlite": UserManager,
+            "mysql": MySQLUserManager,
+            "postgres": PostgresUserManager,
+        }
+    )
+    _BACKENDS: ClassVar[frozenset[str]] = frozenset(backend_to_class)
+
+    # One manager (engine, pool, schema setup) per distinct configuration, least recently
+    # used first; bounded because every distinct user_id is a distinct configuration
+    _instances: ClassVar[OrderedDict[tuple, Any]] = OrderedDict()
+    _max_instances: ClassVar[int] = 32
+    _lock: ClassVar[threading.Lock] = threading.Lock()
 
     @classmethod
     def from_config(
@@ -23,6 +38,11 @@ class UserManagerFactory:
     ) -> UserManager | MySQLUserManager | PostgresUserManager:
         """Create a user manager instance from configuration.
 
+        Managers are cached per backend and resolved configuration, so identical
+        configurations share one instance. The returned manager is shared: callers
+        must not ``close()`` it. The least recently used manager is closed once more
+        than ``_max_instances`` configurations are cached.
+
         Args:
             config_factory: Configuration factory containing backend and config
 
@@ -33,32 +53,61 @@ class UserManagerFactory:
             ValueError: If backend is not supported
         """
         backend = config_factory.backend
-        if backend not in cls.backend_to_class:
+        if backend not in cls._BACKENDS:
             raise ValueError(f"Invalid user manager backend: {backend}")
 
         config = config_factory.config
-        user_id = getattr(config, "user_id", "root")
+        user_id = config.user_id
 
-        env_backend = (
-            os.getenv("MOS_USER_MANAGER") or os.getenv("MOS_USER_MANAGER_BACKEND") or ""
-        ).lower()
+        env_backend = _get_env_backend()
 
-        if env_backend and env_backend in cls.backend_to_class:
+        if env_backend and env_backend in cls._BACKENDS:
             backend = env_backend
-            if backend == "mysql":
-                env_kwargs = _load_mysql_env_config(user_id)
-            elif backend == "postgres":
-                env_kwargs = _load_postgres_env_config(user_id)
-            else:
-                env_kwargs = {"user_id": user_id}
+            loader = _ENV_LOADERS.get(backend)
+            env_kwargs = loader(user_id) if loader else {"user_id": user_id}
 
             config_cls = config_factory.backend_to_class[backend]
             config = config_cls(**env_kwargs)
 
-        user_manager_class = cls.backend_to_class[backend]
+        kwargs = dump_user_config(config)
+        key = (backend, tuple(sorted(kwargs.items())))
+        with cls._lock:
+            instance = cls._instances.get(key)
+            if instance is not None:
+                cls._instances.move_to_end(key)
+                return instance
+
+        # Build outside the lock: connecting and running DDL against a slow database
+        # must not block lookups for unrelated configurations
+        created = cls.backend_to_class[backend](**kwargs)
+
+        evicted = []
+        with cls._lock:
+            # Double-check pattern: another thread may have built the same manager meanwhile
+            instance = cls._instances.get(key)
+            if instance is not None:
+                cls._instances.move_to_end(key)
+                evicted.append(created)
+            else:
+                instance = cls._instances[key] = created
+                while len(cls._instances) > cls._max_instances:
+                    evicted.append(cls._instances.popitem(last=False)[1])
 
-        # Use model_dump() to convert Pydantic model to dict and unpack as kwargs
-        return user_manager_class(**config.model_dump(by_alias=True))
+        # Disposing an engine only drops its pooled connections; a caller still holding
+        # an evicted manager transparently reconnects on its next query
+        for manager in evicted:
+            manager.close()
+        return instance
+
+    @classmethod
+    def reset(cls) -> None:
+        """Close and forget all cached user managers and initialized schemas, e.g. between tests."""
+        with cls._lock:
+            managers = list(cls._instances.values())
+            cls._instances.clear()
+        for manager in managers:
+            manager.close()
+        PostgresUserManager.reset_schema_cache()
 
     @classmethod
     def create_sqlite(cls, db_path: str | None = None, user_id: str = "root") -> UserManager:
@@ -126,6 +175,8 @@ class UserManagerFactory:
         database: str = "memos_users",
         schema: str = "memos",
         sslmode: str | None = None,
+        pool_pre_ping: bool = True,
+        pool_recycle: int = -1,
     ) -> PostgresUserManager:
         """Create Postgres user manager with specified configuration."""
 
@@ -140,33 +191,94 @@ class UserManagerFactory:
                 "database": database,
                 "schema": schema,
                 "sslmode": sslmode,
+                "pool_pre_ping": pool_pre_ping,
+                "pool_recycle": pool_recycle,
             },
         )
         return cls.from_config(config_factory)
 
 
-def _load_mysql_env_config(user_id: str) -> dict[str, Any]:
-    return {
-        "user_id": user_id,
-        "host": os.getenv("MYSQL_HOST", "localhost"),
-        "port": int(os.getenv("MYSQL_PORT", "3306")),
-        "username": os.getenv("MYSQL_USERNAME", "root"),
-        "password": os.getenv("MYSQL_PASSWORD", ""),
-        "database": os.getenv("MYSQL_DATABASE", "memos_users"),
-        "charset": os.getenv("MYSQL_CHARSET", "utf8mb4"),
+_MYSQL_ENV_SPEC = (
+    # (config field, env var, default)
+    ("host", "MYSQL_HOST", "localhost"),
+    ("username", "MYSQL_USERNAME", "root"),
+    ("password", "MYSQL_PASSWORD", ""),
+    ("database", "MYSQL_DATABASE", "memos_users"),
+    ("charset", "MYSQL_CHARSET", "utf8mb4"),
+)
+
+_POSTGRES_ENV_SPEC = (
+    # (config field, MOS_-prefixed env var, plain env var, default)
+    ("host", "MOS_POSTGRES_HOST", "POSTGRES_HOST", "localhost"),
+    ("username", "MOS_POSTGRES_USERNAME", "POSTGRES_USERNAME", "postgres"),
+    ("password", "MOS_POSTGRES_PASSWORD", "POSTGRES_PASSWORD", ""),
+    ("database", "MOS_POSTGRES_DATABASE", "POSTGRES_DATABASE", "memos_users"),
+    ("schema", "MOS_POSTGRES_SCHEMA", "POSTGRES_SCHEMA", "memos"),
+    ("sslmode", "MOS_POSTGRES_SSLMODE", "POSTGRES_SSLMODE", ""),
+)
+
+
+def _resolve_env(primary: str, fallback: str, default: str) -> str:
+    """Read ``primary``, only consulting ``fallback`` when ``primary`` is unset."""
+    value = os.environ.get(primary)
+    return value if value is not None else os.environ.get(fallback, default)
+
+
+# Settings are read on first use only, so an unrelated MYSQL_PORT (e.g. Kubernetes'
+# tcp://host:port service variable) cannot break imports for other backends
+@functools.cache
+def _mysql_env_settings() -> Mapping[str, Any]:
+    settings: dict[str, Any] = {
+        field: os.environ.get(key, default) for field, key, default in _MYSQL_ENV_SPEC
     }
+    settings["port"] = int(os.environ.get("MYSQL_PORT", "3306"))
+    return types.MappingProxyType(settings)
 
 
-def _load_postgres_env_config(user_id: str) -> dict[str, Any]:
-    return {
-        "user_id": user_id,
-        "host": os.getenv("MOS_POSTGRES_HOST", os.getenv("POSTGRES_HOST", "localhost")),
-        "port": int(os.getenv("MOS_POSTGRES_PORT", os.getenv("POSTGRES_PORT", "5432"))),
-        "username": os.getenv("MOS_POSTGRES_USERNAME", os.getenv("POSTGRES_USERNAME", "postgres")),
-        "password": os.getenv("MOS_POSTGRES_PASSWORD", os.getenv("POSTGRES_PASSWORD", "")),
-        "database": os.getenv(
-            "MOS_POSTGRES_DATABASE", os.getenv("POSTGRES_DATABASE", "memos_users")
-        ),
-        "schema": os.getenv("MOS_POSTGRES_SCHEMA", os.getenv("POSTGRES_SCHEMA", "memos")),
-        "sslmode": (os.getenv("MOS_POSTGRES_SSLMODE", os.getenv("POSTGRES_SSLMODE", "")) or None),
+@functools.cache
+def _postgres_env_settings() -> Mapping[str, Any]:
+    settings: dict[str, Any] = {
+        field: _resolve_env(primary, fallback, default)
+        for field, primary, fallback, default in _POSTGRES_ENV_SPEC
     }
+    settings["port"] = int(_resolve_env("MOS_POSTGRES_PORT", "POSTGRES_PORT", "5432"))
+    settings["sslmode"] = settings["sslmode"] or None
+    settings["pool_pre_ping"] = os.getenv("MOS_POSTGRES_POOL_PRE_PING", "true").lower() == "true"
+    settings["pool_recycle"] = int(os.getenv("MOS_POSTGRES_POOL_RECYCLE", "-1"))
+    return types.MappingProxyType(settings)
+
+
+def _load_mysql_env_config(user_id: str) -> dict[str, Any]:
+    return {"user_id": user_id, **_mysql_env_settings()}
+
+
+def _load_postgres_env_config(user_id: str) -> dict[str, Any]:
+    return {"user_id": user_id, **_postgres_env_settings()}
+
+
+# Backends whose connection settings come from the environment; others only need user_id
+_ENV_LOADERS = {
+    "mysql": _load_mysql_env_config,
+    "postgres": _load_postgres_env_config,
+}
+
+# Environment variables do not change during the process lifetime, so resolve them once
+_ENV_BACKEND: str | None = None
+
+
+def _get_env_backend() -> str:
+    """Return the user manager backend forced through the environment ("" if unset)."""
+    global _ENV_BACKEND
+    if _ENV_BACKEND is None:
+        _ENV_BACKEND = (
+            os.getenv("MOS_USER_MANAGER") or os.getenv("MOS_USER_MANAGER_BACKEND") or ""
+        ).lower()
+    return _ENV_BACKEND
+
+
+def refresh_env_cache() -> None:
+    """Re-read the user manager environment variables, e.g. after a test changes them."""
+    global _ENV_BACKEND
+    _ENV_BACKEND = None
+    _mysql_env_settings.cache_clear()
+    _postgres_env_settings.cache_clear()
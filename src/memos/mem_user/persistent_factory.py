@@ -1,46 +1,58 @@
 import os
+import types
 
+from collections.abc import Mapping
 from typing import Any, ClassVar
 
-from memos.configs.mem_user import UserManagerConfigFactory
+from memos.configs.mem_user import UserManagerConfigFactory, dump_user_config
+from memos.mem_user.factory import _load_mysql_env_config
+from memos.mem_user.factory import refresh_env_cache as _refresh_shared_env_cache
 from memos.mem_user.mysql_persistent_user_manager import MySQLPersistentUserManager
 from memos.mem_user.persistent_user_manager import PersistentUserManager
 
 
-def _load_mysql_env_config(user_id: str) -> dict[str, Any]:
-    return {
-        "user_id": user_id,
-        "host": os.getenv("MYSQL_HOST", "localhost"),
-        "port": int(os.getenv("MYSQL_PORT", "3306")),
-        "username": os.getenv("MYSQL_USERNAME", "root"),
-        "password": os.getenv("MYSQL_PASSWORD", ""),
-        "database": os.getenv("MYSQL_DATABASE", "memos_users"),
-        "charset": os.getenv("MYSQL_CHARSET", "utf8mb4"),
-    }
-
-
-def _load_postgres_env_config(user_id: str) -> dict[str, Any]:
-    return {
-        "user_id": user_id,
-        "host": os.getenv("MOS_POSTGRES_HOST", os.getenv("POSTGRES_HOST", "localhost")),
-        "port": int(os.getenv("MOS_POSTGRES_PORT", os.getenv("POSTGRES_PORT", "5432"))),
-        "username": os.getenv("MOS_POSTGRES_USERNAME", os.getenv("POSTGRES_USERNAME", "postgres")),
-        "password": os.getenv("MOS_POSTGRES_PASSWORD", os.getenv("POSTGRES_PASSWORD", "")),
-        "database": os.getenv(
-            "MOS_POSTGRES_DATABASE", os.getenv("POSTGRES_DATABASE", "memos_users")
-        ),
-        "schema": os.getenv("MOS_POSTGRES_SCHEMA", os.getenv("POSTGRES_SCHEMA", "memos")),
-        "sslmode": (os.getenv("MOS_POSTGRES_SSLMODE", os.getenv("POSTGRES_SSLMODE", "")) or None),
-    }
+# Backends whose connection settings come from the environment; others only need user_id
+_ENV_LOADERS = {"mysql": _load_mysql_env_config}
+
+
+# Environment variables do not change during the process lifetime, so resolve them once
+_ENV_BACKEND: str | None = None
+
+
+def _get_env_backend() -> str:
+    """Return the persistent user manager backend forced through the environment ("" if unset)."""
+    global _ENV_BACKEND
+    if _ENV_BACKEND is None:
+        _ENV_BACKEND = (
+            os.getenv("MOS_PERSISTENT_USER_MANAGER")
+            or os.getenv("MOS_USER_MANAGER")
+            or os.getenv("MOS_USER_MANAGER_BACKEND")
+            or ""
+        ).lower()
+    return _ENV_BACKEND
+
+
+def refresh_env_cache() -> None:
+    """Re-read the persistent user manager environment variables, e.g. after a test changes them.
+
+    The MySQL settings are shared with ``memos.mem_user.factory`` and refreshed there too.
+    """
+    global _ENV_BACKEND
+    _ENV_BACKEND = None
+    _refresh_shared_env_cache()
 
 
 class PersistentUserManagerFactory:
     """Factory class for creating persistent user manager instances."""
 
-    backend_to_class: ClassVar[dict[str, Any]] = {
-        "sqlite": PersistentUserManager,
-        "mysql": MySQLPersistentUserManager,
-    }
+    # Read-only so the registry cannot drift from _BACKENDS at runtime
+    backend_to_class: ClassVar[Mapping[str, Any]] = types.MappingProxyType(
+        {
+            "sqlite": PersistentUserManager,
+            "mysql": MySQLPersistentUserManager,
+        }
+    )
+    _BACKENDS: ClassVar[frozenset[str]] = frozenset(backend_to_class)
 
     @classmethod
     def from_config(
@@ -58,35 +70,25 @@ class PersistentUserManagerFactory:
             ValueError: If backend is not supported
         """
         backend = config_factory.backend
-        if backend not in cls.backend_to_class:
+        if backend not in cls._BACKENDS:
             raise ValueError(f"Invalid persistent user manager backend: {backend}")
 
         config = config_factory.config
-        user_id = getattr(config, "user_id", "root")
+        user_id = config.user_id
 
-        env_backend = (
-            os.getenv("MOS_PERSISTENT_USER_MANAGER")
-            or os.getenv("MOS_USER_MANAGER")
-            or os.getenv("MOS_USER_MANAGER_BACKEND")
-            or ""
-        ).lower()
+        env_backend = _get_env_backend()
 
-        if env_backend and env_backend in cls.backend_to_class:
+        if env_backend and env_backend in cls._BACKENDS:
             backend = env_backend
-            if backend == "mysql":
-                env_kwargs = _load_mysql_env_config(user_id)
-            elif backend == "postgres":
-                env_kwargs = _load_postgres_env_config(user_id)
-            else:
-                env_kwargs = {"user_id": user_id}
+            loader = _ENV_LOADERS.get(backend)
+            env_kwargs = loader(user_id) if loader else {"user_id": user_id}
 
             config_cls = config_factory.backend_to_class[backend]
             config = config_cls(**env_kwargs)
 
         user_manager_class = cls.backend_to_class[backend]
 
-        # Use model_dump() to convert Pydantic model to dict and unpack as kwargs
-        return user_manager_class(**config.model_dump(by_alias=True))
+        return user_manager_class(**dump_user_config(config))
 
     @classmethod
     def create_sqlite(
@@ -2,35 +2,100 @@
 
 from __future__ import annotations
 
+import functools
+import re
 import string
+import threading
 
-from sqlalchemy import create_engine, event, text
+from typing import TYPE_CHECKING, ClassVar, TypeVar
+
+from sqlalchemy import create_engine, select, text
 from sqlalchemy.engine import URL
+from sqlalchemy.exc import DBAPIError, ProgrammingError
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.sql import quoted_name
 
 from memos.log import get_logger
-from memos.mem_user.mysql_user_manager import Base, MySQLUserManager
+from memos.mem_user.mysql_user_manager import Base, MySQLUserManager, User
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 
 logger = get_logger(__name__)
 
-_ALLOWED_SCHEMA_CHARS = set(string.ascii_letters + string.digits + "_")
+_SCHEMA_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_SCHEMA_FIRST_CHARS = frozenset(string.ascii_letters + "_")
+
+T = TypeVar("T")
 
 
 def _validate_schema(schema: str) -> str:
     if not schema:
         raise ValueError("Postgres schema name cannot be empty")
-    if schema[0] not in string.ascii_letters + "_":
-        raise ValueError("Postgres schema name must start with a letter or underscore")
-    if any(char not in _ALLOWED_SCHEMA_CHARS for char in schema):
+    if not _SCHEMA_RE.fullmatch(schema):
+        # Only invalid names pay for working out which rule they broke
+        if schema[0] not in _SCHEMA_FIRST_CHARS:
+            raise ValueError("Postgres schema name must start with a letter or underscore")
         raise ValueError("Postgres schema name may only contain letters, numbers, and underscores")
     return schema
 
 
+@functools.lru_cache(maxsize=128)
+def _build_pg_url(
+    username: str,
+    password: str,
+    host: str,
+    port: int,
+    database: str,
+    schema: str,
+    sslmode: str | None,
+) -> URL:
+    """Build the (immutable) connection URL once per distinct set of connection params."""
+    # libpq applies search_path at connection startup; quoting keeps mixed-case names intact
+    query: dict[str, str] = {"options": f'-csearch_path="{schema}"'}
+    if sslmode:
+        query["sslmode"] = sslmode
+
+    return URL.create(
+        "postgresql+psycopg2",
+        username=username or None,
+        password=password or None,
+        host=host,
+        port=port,
+        database=database,
+        query=query,
+    )
+
+
+def _retry_on_disconnect(method: Callable[..., T]) -> Callable[..., T]:
+    """Retry a read-only query once if its pooled connection turned out to be dead.
+
+    With ``pool_pre_ping`` disabled a connection dropped by the server or a load balancer
+    is only noticed when used. SQLAlchemy then invalidates it, so the retry gets a fresh one.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        except DBAPIError as e:
+            if not e.connection_invalidated:
+                raise
+            logger.warning("Postgres connection lost during %s, retrying once", method.__name__)
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 class PostgresUserManager(MySQLUserManager):
     """User management system for MemOS using Postgres."""
 
+    # Schemas whose DDL already ran in this process, keyed by (connection_url, schema)
+    _initialized_schemas: ClassVar[set[tuple[str, str]]] = set()
+    _schema_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(
         self,
         user_id: str = "root",
@@ -41,38 +106,25 @@ class PostgresUserManager(MySQLUserManager):
         database: str = "memos_users",
         schema: str = "memos",
         sslmode: str | None = None,
+        pool_pre_ping: bool = True,
+        pool_recycle: int = -1,
     ) -> None:
         schema = _validate_schema(schema)
-        query: dict[str, str] = {"options": f"-csearch_path={schema}"}
-        if sslmode:
-            query["sslmode"] = sslmode
-
-        connection_url = URL.create(
-            "postgresql+psycopg2",
-            username=username or None,
-            password=password or None,
-            host=host,
-            port=port,
-            database=database,
-            query=query,
-        )
+        connection_url = _build_pg_url(username, password, host, port, database, schema, sslmode)
 
         self.schema = schema
         self.connection_url = str(connection_url)
-        self.engine = create_engine(connection_url, echo=False, pool_pre_ping=True)
+        # Writes swallow errors and roll back, so keep the checkout ping on by default;
+        # pool_pre_ping=False with a pool_recycle (seconds) trades it for periodic reconnects
+        self.engine = create_engine(
+            connection_url,
+            echo=False,
+            pool_pre_ping=pool_pre_ping,
+            pool_recycle=pool_recycle,
+        )
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
 
-        def _set_search_path(dbapi_connection, _):
-            with dbapi_connection.cursor() as cursor:
-                cursor.execute(f'SET search_path TO "{schema}"')
-
-        event.listen(self.engine, "connect", _set_search_path)
-
-        with self.engine.begin() as connection:
-            connection.execute(text(f"CREATE SCHEMA IF NOT EXISTS {quoted_name(schema, True)}"))
-
-        # Create tables inside the configured schema
-        Base.metadata.create_all(bind=self.engine)
+        self._ensure_schema()
 
         # Initialize with root user if no users exist
         self._init_root_user(user_id)
@@ -85,6 +137,49 @@ class PostgresUserManager(MySQLUserManager):
             schema,
         )
 
+    @classmethod
+    def reset_schema_cache(cls) -> None:
+        """Forget which schemas were initialized, so the next manager re-runs the DDL."""
+        with cls._schema_lock:
+            cls._initialized_schemas.clear()
+
+    def _create_schema(self) -> None:
+        with self.engine.begin() as connection:
+            connection.execute(
+                text(f"CREATE SCHEMA IF NOT EXISTS {quoted_name(self.schema, True)}")
+            )
+            # Create tables inside the configured schema, in the same transaction
+            Base.metadata.create_all(bind=connection, checkfirst=True)
+
+    def _ensure_schema(self) -> None:
+        """Run the schema DDL once per process and database, recreating it if it vanished."""
+        schema_key = (self.connection_url, self.schema)
+        if schema_key not in self._initialized_schemas:
+            with self._schema_lock:
+                # Double-check pattern to prevent race conditions
+                if schema_key not in self._initialized_schemas:
+                    self._create_schema()
+                    self._initialized_schemas.add(schema_key)
+                    return
+
+        # The DDL was skipped on the strength of the cache; one cheap query confirms the
+        # tables still exist, since the database may have been recreated under the same URL
+        try:
+            with self.engine.connect() as connection:
+                connection.execute(select(User.user_id).limit(1))
+        except ProgrammingError:
+            logger.warning("Postgres schema '%s' lost its tables, recreating them", self.schema)
+            with self._schema_lock:
+                self._create_schema()
+
+    # Idempotent reads are safe to replay; writes keep their own rollback handling
+    get_user = _retry_on_disconnect(MySQLUserManager.get_user)
+    get_user_by_name = _retry_on_disconnect(MySQLUserManager.get_user_by_name)
+    list_users = _retry_on_disconnect(MySQLUserManager.list_users)
+    get_cube = _retry_on_disconnect(MySQLUserManager.get_cube)
+    validate_user_cube_access = _retry_on_disconnect(MySQLUserManager.validate_user_cube_access)
+    get_user_cubes = _retry_on_disconnect(MySQLUserManager.get_user_cubes)
+
     def close(self) -> None:
         if hasattr(self, "engine"):
             self.engine.dispose()
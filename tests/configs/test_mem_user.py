@@ -0,0 +1,72 @@
+import pytest
+
+from pydantic import ValidationError
+
+from memos.configs.mem_user import (
+    MySQLUserManagerConfig,
+    PostgresUserManagerConfig,
+    SQLiteUserManagerConfig,
+    UserManagerConfigFactory,
+    dump_user_config,
+)
+from tests.utils import check_config_instantiation_invalid, check_config_instantiation_valid
+
+
+def test_user_manager_configs_instantiation():
+    check_config_instantiation_valid(SQLiteUserManagerConfig, {"db_path": "/tmp/users.db"})
+    check_config_instantiation_valid(MySQLUserManagerConfig, {"host": "db", "port": 3307})
+    check_config_instantiation_valid(PostgresUserManagerConfig, {"schema": "memos_test"})
+
+    check_config_instantiation_invalid(SQLiteUserManagerConfig)
+    check_config_instantiation_invalid(MySQLUserManagerConfig)
+    check_config_instantiation_invalid(PostgresUserManagerConfig)
+
+
+def test_user_manager_configs_are_frozen():
+    config = PostgresUserManagerConfig(schema="memos_test")
+
+    assert config.model_schema == "memos.configs.mem_user.PostgresUserManagerConfig"
+    with pytest.raises(ValidationError):
+        config.host = "elsewhere"
+
+
+def test_user_manager_config_factory():
+    factory = UserManagerConfigFactory(backend="postgres", config={"port": "5433"})
+    assert isinstance(factory.config, PostgresUserManagerConfig)
+    assert factory.config.port == 5433
+
+    with pytest.raises(ValidationError, match="Unsupported user manager backend"):
+        UserManagerConfigFactory(backend="oracle", config={})
+
+
+def test_user_manager_config_factory_reuses_identical_configs():
+    first = UserManagerConfigFactory(backend="mysql", config={"host": "db", "port": 3307})
+    second = UserManagerConfigFactory(backend="mysql", config={"port": 3307, "host": "db"})
+    other = UserManagerConfigFactory(backend="mysql", config={"host": "db2", "port": 3307})
+
+    assert first.config is second.config
+    assert first.config is not other.config
+
+
+def test_user_manager_config_cache_distinguishes_value_types():
+    # 3307.0 == 3307, but strict validation must not depend on what is already cached
+    UserManagerConfigFactory(backend="mysql", config={"host": "typed", "port": 3307})
+
+    with pytest.raises(ValidationError):
+        UserManagerConfigFactory(backend="mysql", config={"host": "typed", "port": 3307.0})
+
+
+def test_every_registered_config_declares_user_id():
+    # The user manager factories read config.user_id directly
+    for config_class in UserManagerConfigFactory.backend_to_class.values():
+        assert "user_id" in config_class.model_fields
+
+
+def test_dump_user_config_matches_model_dump():
+    configs = [
+        SQLiteUserManagerConfig(db_path="/tmp/users.db", user_id="alice"),
+        MySQLUserManagerConfig(host="db", port=3307, password="secret"),
+        PostgresUserManagerConfig(schema="memos_test", sslmode="require"),
+    ]
+    for config in configs:
+        assert dump_user_config(config) == config.model_dump(by_alias=True)
@@ -1,12 +1,20 @@
+import asyncio
+import base64
 import unittest
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
+
+import numpy as np
 
 from memos.configs.embedder import UniversalAPIEmbedderConfig
-from memos.embedders.universal_api import UniversalAPIEmbedder
+from memos.embedders.universal_api import UniversalAPIEmbedder, _get_universal_openai
 
 
 class TestUniversalAPIEmbedder(unittest.TestCase):
+    def setUp(self):
+        # Clients are cached per process; start each test from a clean pool
+        _get_universal_openai.cache_clear()
+
     @patch("memos.embedders.universal_api.OpenAIClient")
     def test_embed_single_text(self, mock_openai_client):
         """Test embedding a single text with OpenAI provider."""
@@ -30,12 +38,14 @@ class TestUniversalAPIEmbedder(unittest.TestCase):
         mock_openai_client.assert_called_once_with(
             api_key="fake-api-key",
             base_url="https://api.openai.com/v1",
+            http_client=ANY,
         )
 
         # Assert embeddings.create called with correct params
         embedder.client.embeddings.create.assert_called_once_with(
             model="text-embedding-3-large",
             input=text,
+            encoding_format="base64",
         )
 
         self.assertEqual(len(result[0]), 4)
@@ -66,11 +76,146 @@ class TestUniversalAPIEmbedder(unittest.TestCase):
         embedder.client.embeddings.create.assert_called_once_with(
             model="text-embedding-3-large",
             input=texts,
+            encoding_format="base64",
         )
 
         self.assertEqual(len(result), 3)
         self.assertEqual(result[0], [0.1, 0.2])
 
+    @patch("memos.embedders.universal_api.OpenAIClient")
+    def test_client_shared_across_instances(self, mock_openai_client):
+        """Test embedders with identical credentials reuse one client."""
+        config = UniversalAPIEmbedderConfig(
+            provider="openai",
+            api_key="fake-api-key",
+            base_url="https://api.openai.com/v1",
+            model_name_or_path="text-embedding-3-large",
+        )
+
+        first = UniversalAPIEmbedder(config)
+        second = UniversalAPIEmbedder(config)
+
+        self.assertIs(first.client, second.client)
+        mock_openai_client.assert_called_once()
+
+    @patch("memos.embedders.universal_api._ASYNC_EMBED_CHUNK_SIZE", 2)
+    @patch("memos.embedders.universal_api.AsyncOpenAIClient")
+    @patch("memos.embedders.universal_api.OpenAIClient")
+    def test_embed_many_preserves_order(self, mock_openai_client, mock_async_client):
+        """Test concurrent async embedding keeps results aligned with inputs."""
+
+        async def fake_create(model, input, encoding_format):
+            return MagicMock(data=[MagicMock(embedding=[float(len(t))]) for t in input])
+
+        aclient = mock_async_client.return_value
+        aclient.embeddings.create = AsyncMock(side_effect=fake_create)
+        aclient.__aenter__ = AsyncMock(return_value=aclient)
+        aclient.__aexit__ = AsyncMock(return_value=None)
+
+        config = UniversalAPIEmbedderConfig(
+            provider="openai",
+            api_key="fake-api-key",
+            base_url="https://api.openai.com/v1",
+            model_name_or_path="text-embedding-3-large",
+        )
+
+        embedder = UniversalAPIEmbedder(config)
+        batches = [["a", "bb", "ccc"], ["dddd"]]
+        result = embedder.embed_many(batches)
+
+        self.assertEqual(result, [[[1.0], [2.0], [3.0]], [[4.0]]])
+        # First batch is split into two sub-requests, second batch needs one
+        self.assertEqual(aclient.embeddings.create.await_count, 3)
+
+    @patch("memos.embedders.universal_api.AsyncOpenAIClient")
+    @patch("memos.embedders.universal_api.OpenAIClient")
+    def test_aembed_uses_one_async_client_per_event_loop(
+        self, mock_openai_client, mock_async_client
+    ):
+        """Test the async client is created lazily and never reused across event loops."""
+
+        async def fake_create(model, input, encoding_format):
+            return MagicMock(data=[MagicMock(embedding=[1.0]) for _ in input])
+
+        mock_async_client.side_effect = lambda **kwargs: MagicMock(
+            embeddings=MagicMock(create=AsyncMock(side_effect=fake_create))
+        )
+
+        config = UniversalAPIEmbedderConfig(
+            provider="openai",
+            api_key="fake-api-key",
+            base_url="https://api.openai.com/v1",
+            model_name_or_path="text-embedding-3-large",
+        )
+
+        embedder = UniversalAPIEmbedder(config)
+        mock_async_client.assert_not_called()
+
+        async def embed_twice():
+            await embedder.aembed(["a"])
+            return await embedder.aembed(["b"])
+
+        self.assertEqual(asyncio.run(embed_twice()), [[1.0]])
+        self.assertEqual(mock_async_client.call_count, 1)
+
+        asyncio.run(embedder.aembed(["c"]))
+        self.assertEqual(mock_async_client.call_count, 2)
+        # The client of the first, now closed, loop is no longer kept
+        self.assertEqual(len(embedder._aclients), 1)
+
+    @patch("memos.embedders.universal_api._EMBED_FALLBACK_MODEL", "fallback-embedding")
+    @patch("memos.embedders.universal_api.OpenAIClient")
+    def test_missing_model_falls_back(self, mock_openai_client):
+        """Test a missing model is retried once on the fallback embedding model."""
+        create = mock_openai_client.return_value.embeddings.create
+        create.side_effect = [
+            Exception("Error code: 404 - model_not_found"),
+            MagicMock(data=[MagicMock(embedding=[0.1, 0.2])]),
+        ]
+
+        config = UniversalAPIEmbedderConfig(
+            provider="openai",
+            api_key="fake-api-key",
+            base_url="https://api.openai.com/v1",
+            model_name_or_path="missing-model",
+        )
+
+        result = UniversalAPIEmbedder(config).embed(["text"])
+
+        self.assertEqual(result, [[0.1, 0.2]])
+        self.assertEqual(create.call_args.kwargs["model"], "fallback-embedding")
+
+    @patch("memos.embedders.universal_api.OpenAIClient")
+    def test_embed_np_decodes_base64(self, mock_openai_client):
+        """Test embed_np requests base64 vectors and returns a float32 matrix."""
+        vectors = np.array([[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]], dtype=np.float32)
+        mock_response = MagicMock()
+        mock_response.data = [
+            MagicMock(embedding=base64.b64encode(vectors[0].tobytes()).decode()),
+            # Some compatible servers ignore encoding_format and return floats
+            MagicMock(embedding=vectors[1].tolist()),
+        ]
+        mock_openai_client.return_value.embeddings.create.return_value = mock_response
+
+        config = UniversalAPIEmbedderConfig(
+            provider="openai",
+            api_key="fake-api-key",
+            base_url="https://api.openai.com/v1",
+            model_name_or_path="text-embedding-3-large",
+        )
+
+        embedder = UniversalAPIEmbedder(config)
+        texts = ["First text.", "Second text."]
+        result = embedder.embed_np(texts)
+
+        embedder.client.embeddings.create.assert_called_once_with(
+            model="text-embedding-3-large",
+            input=texts,
+            encoding_format="base64",
+        )
+        self.assertEqual(result.dtype, np.float32)
+        np.testing.assert_array_equal(result, vectors)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -5,9 +5,14 @@ from unittest.mock import MagicMock
 
 from memos.configs.llm import DeepSeekLLMConfig
 from memos.llms.deepseek import DeepSeekLLM
+from memos.llms.openai import _get_openai_client
 
 
 class TestDeepSeekLLM(unittest.TestCase):
+    def setUp(self):
+        # Clients are cached per process; keep mocks from leaking between tests
+        _get_openai_client.cache_clear()
+
     def test_deepseek_llm_generate_with_and_without_think_prefix(self):
         """Test DeepSeekLLM generate method with and without <think> tag removal."""
 
@@ -32,7 +37,7 @@ class TestDeepSeekLLM(unittest.TestCase):
             }
         )
         llm_with_think = DeepSeekLLM(config_with_think)
-        llm_with_think.client.chat.completions.create = MagicMock(return_value=mock_response)
+        llm_with_think._chat_create = MagicMock(return_value=mock_response)
 
         output_with_think = llm_with_think.generate([{"role": "user", "content": "Hello"}])
         self.assertEqual(output_with_think, full_content)
@@ -40,7 +45,7 @@ class TestDeepSeekLLM(unittest.TestCase):
         # Config with think tag removed
         config_without_think = config_with_think.model_copy(update={"remove_think_prefix": True})
         llm_without_think = DeepSeekLLM(config_without_think)
-        llm_without_think.client.chat.completions.create = MagicMock(return_value=mock_response)
+        llm_without_think._chat_create = MagicMock(return_value=mock_response)
 
         output_without_think = llm_without_think.generate([{"role": "user", "content": "Hello"}])
         self.assertEqual(output_without_think, "Hello from DeepSeek!")
@@ -76,7 +81,7 @@ class TestDeepSeekLLM(unittest.TestCase):
             }
         )
         llm = DeepSeekLLM(config)
-        llm.client.chat.completions.create = mock_chat_completions_create
+        llm._chat_create = mock_chat_completions_create
 
         messages = [{"role": "user", "content": "Say hello"}]
         streamed = list(llm.generate_stream(messages))
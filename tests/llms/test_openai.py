@@ -1,13 +1,18 @@
 import unittest
 
 from types import SimpleNamespace
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from memos.configs.llm import LLMConfigFactory
 from memos.llms.factory import LLMFactory
+from memos.llms.openai import _get_openai_client
 
 
 class TestLLMFactoryWithOpenAIBackend(unittest.TestCase):
+    def setUp(self):
+        # Clients are cached per process; keep mocks from leaking between tests
+        _get_openai_client.cache_clear()
+
     def test_llm_factory_with_mocked_openai_backend(self):
         """Test LLMFactory with mocked OpenAI backend."""
         mock_chat_completions_create = MagicMock()
@@ -31,7 +36,7 @@ class TestLLMFactoryWithOpenAIBackend(unittest.TestCase):
             }
         )
         llm = LLMFactory.from_config(config)
-        llm.client.chat.completions.create = mock_chat_completions_create
+        llm._chat_create = mock_chat_completions_create
         messages = [
             {"role": "user", "content": "Hello, who are you"},
         ]
@@ -82,7 +87,7 @@ class TestLLMFactoryWithOpenAIBackend(unittest.TestCase):
 
         # Instantiate the LLM and inject the mocked stream method
         llm = LLMFactory.from_config(config)
-        llm.client.chat.completions.create = mock_chat_completions_create
+        llm._chat_create = mock_chat_completions_create
 
         # Input message to the model
         messages = [{"role": "user", "content": "Think and say hello"}]
@@ -97,6 +102,79 @@ class TestLLMFactoryWithOpenAIBackend(unittest.TestCase):
         self.assertIn("Hello, world!", response)
 
         # Optional: check structure of stream response
-        self.assertEqual(response_parts[0], "<think>")
+        self.assertEqual(response_parts[0], "<think>I am thinking")
+        self.assertEqual(response_parts[1], "</think>Hello")
         self.assertTrue(response.startswith("<think>I am thinking"))
         self.assertTrue(response.endswith("Hello, world!"))
+
+    def test_gpt5_kwargs_resolved_once(self):
+        """Test gpt-5 request kwargs are built in __init__ without mutating the config."""
+        mock_response = MagicMock()
+        mock_response.choices[0].message.content = "Hi"
+        mock_chat_completions_create = MagicMock(return_value=mock_response)
+
+        extra_body = {"top_p": 0.5, "logprobs": True, "enable_thinking": False}
+        config = LLMConfigFactory.model_validate(
+            {
+                "backend": "openai",
+                "config": {
+                    "model_name_or_path": "gpt-5-mini",
+                    "max_tokens": 512,
+                    "api_key": "sk-xxxx",
+                    "extra_body": extra_body,
+                },
+            }
+        )
+        llm = LLMFactory.from_config(config)
+        llm._chat_create = mock_chat_completions_create
+
+        messages = [{"role": "user", "content": "Hello"}]
+        self.assertEqual(llm.generate(messages), "Hi")
+
+        mock_chat_completions_create.assert_called_once_with(
+            model="gpt-5-mini",
+            messages=messages,
+            extra_body={"enable_thinking": False},
+            temperature=1,
+            max_completion_tokens=512,
+        )
+        self.assertEqual(extra_body, {"top_p": 0.5, "logprobs": True, "enable_thinking": False})
+        self.assertNotIn("messages", llm._base_generate_kwargs)
+
+    def test_generate_falls_back_when_model_missing(self):
+        """Test generate retries on the fallback model when the configured one is missing."""
+        mock_response = MagicMock()
+        mock_response.choices[0].message.content = "fallback answer"
+        mock_chat_completions_create = MagicMock(
+            side_effect=[Exception("Error code: 404 - Model_Not_Found"), mock_response]
+        )
+
+        config = LLMConfigFactory.model_validate(
+            {
+                "backend": "openai",
+                "config": {"model_name_or_path": "gpt-4.1-nano", "api_key": "sk-xxxx"},
+            }
+        )
+        llm = LLMFactory.from_config(config)
+        llm._chat_create = mock_chat_completions_create
+
+        with patch("memos.llms.openai._FALLBACK_MODEL", "gpt-4o"):
+            response = llm.generate([{"role": "user", "content": "Hello"}])
+
+        self.assertEqual(response, "fallback answer")
+        self.assertEqual(mock_chat_completions_create.call_count, 2)
+        self.assertEqual(mock_chat_completions_create.call_args.kwargs["model"], "gpt-4o")
+
+    def test_unrelated_errors_are_raised(self):
+        """Test errors that are not about a missing model propagate unchanged."""
+        config = LLMConfigFactory.model_validate(
+            {
+                "backend": "openai",
+                "config": {"model_name_or_path": "gpt-4.1-nano", "api_key": "sk-xxxx"},
+            }
+        )
+        llm = LLMFactory.from_config(config)
+        llm._chat_create = MagicMock(side_effect=RuntimeError("rate limited"))
+
+        with self.assertRaisesRegex(RuntimeError, "rate limited"):
+            llm.generate([{"role": "user", "content": "Hello"}])
@@ -4,10 +4,15 @@ from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 from memos.configs.llm import QwenLLMConfig
+from memos.llms.openai import _get_openai_client
 from memos.llms.qwen import QwenLLM
 
 
 class TestQwenLLM(unittest.TestCase):
+    def setUp(self):
+        # Clients are cached per process; keep mocks from leaking between tests
+        _get_openai_client.cache_clear()
+
     def test_qwen_llm_generate_with_and_without_think_prefix(self):
         """Test QwenLLM non-streaming response generation with and without <think> prefix removal."""
 
@@ -34,7 +39,7 @@ class TestQwenLLM(unittest.TestCase):
 
         # Instance with think tag enabled
         llm_with_think = QwenLLM(config_with_think)
-        llm_with_think.client.chat.completions.create = MagicMock(return_value=mock_response)
+        llm_with_think._chat_create = MagicMock(return_value=mock_response)
 
         response_with_think = llm_with_think.generate([{"role": "user", "content": "Hi"}])
         self.assertEqual(response_with_think, full_content)
@@ -44,7 +49,7 @@ class TestQwenLLM(unittest.TestCase):
 
         # Instance with think tag removed
         llm_without_think = QwenLLM(config_without_think)
-        llm_without_think.client.chat.completions.create = MagicMock(return_value=mock_response)
+        llm_without_think._chat_create = MagicMock(return_value=mock_response)
 
         response_without_think = llm_without_think.generate([{"role": "user", "content": "Hi"}])
         self.assertEqual(response_without_think, "Hello, world!")
@@ -83,9 +88,9 @@ class TestQwenLLM(unittest.TestCase):
             }
         )
 
-        # Create QwenLLM instance and inject mock client
+        # Create QwenLLM instance and inject mock create call
         llm = QwenLLM(config)
-        llm.client.chat.completions.create = mock_chat_completions_create
+        llm._chat_create = mock_chat_completions_create
 
         messages = [{"role": "user", "content": "Say hello"}]
 
@@ -0,0 +1,184 @@
+"""Tests for UserManagerFactory."""
+
+import threading
+import types
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from memos.mem_user import factory
+from memos.mem_user.factory import UserManagerFactory
+
+
+@pytest.fixture(autouse=True)
+def isolated_factory(monkeypatch):
+    """Ignore env-selected backends and start every test with an empty cache."""
+    monkeypatch.setattr(factory, "_ENV_BACKEND", "")
+    UserManagerFactory.reset()
+    yield
+    UserManagerFactory.reset()
+
+
+def test_identical_configs_share_manager(tmp_path):
+    db_path = str(tmp_path / "users.db")
+
+    first = UserManagerFactory.create_sqlite(db_path=db_path)
+    second = UserManagerFactory.create_sqlite(db_path=db_path)
+
+    assert first is second
+    assert first.get_user("root") is not None
+
+
+def test_different_configs_get_separate_managers(tmp_path):
+    first = UserManagerFactory.create_sqlite(db_path=str(tmp_path / "a.db"))
+    second = UserManagerFactory.create_sqlite(db_path=str(tmp_path / "b.db"))
+
+    assert first is not second
+
+
+def test_reset_clears_cached_managers(tmp_path):
+    db_path = str(tmp_path / "users.db")
+    first = UserManagerFactory.create_sqlite(db_path=db_path)
+    first.close = MagicMock(wraps=first.close)
+
+    UserManagerFactory.reset()
+
+    first.close.assert_called_once()
+    assert UserManagerFactory.create_sqlite(db_path=db_path) is not first
+
+
+def test_cache_evicts_and_closes_least_recently_used(tmp_path, monkeypatch):
+    monkeypatch.setattr(UserManagerFactory, "_max_instances", 2)
+    db_path = str(tmp_path / "users.db")
+    alice = UserManagerFactory.create_sqlite(db_path=db_path, user_id="alice")
+    bob = UserManagerFactory.create_sqlite(db_path=db_path, user_id="bob")
+    alice.close = MagicMock(wraps=alice.close)
+    bob.close = MagicMock(wraps=bob.close)
+
+    # Touch alice so bob becomes the least recently used entry
+    assert UserManagerFactory.create_sqlite(db_path=db_path, user_id="alice") is alice
+    UserManagerFactory.create_sqlite(db_path=db_path, user_id="carol")
+
+    bob.close.assert_called_once()
+    alice.close.assert_not_called()
+    assert len(UserManagerFactory._instances) == 2
+    # An evicted manager keeps working; its engine reconnects on demand
+    assert bob.get_user("bob") is not None
+
+
+def _patch_sqlite_manager(monkeypatch, manager_class):
+    monkeypatch.setattr(
+        UserManagerFactory, "backend_to_class", types.MappingProxyType({"sqlite": manager_class})
+    )
+
+
+def test_slow_construction_does_not_block_other_configs(monkeypatch):
+    started, release = threading.Event(), threading.Event()
+
+    class SlowManager:
+        def __init__(self, db_path, user_id):
+            if db_path == "slow.db":
+                started.set()
+                release.wait(5)
+
+        def close(self):
+            pass
+
+    _patch_sqlite_manager(monkeypatch, SlowManager)
+    worker = threading.Thread(target=UserManagerFactory.create_sqlite, args=("slow.db",))
+    worker.start()
+    try:
+        assert started.wait(5)
+        UserManagerFactory.create_sqlite(db_path="fast.db")
+        # The fast lookup returned while the slow manager was still being built
+        assert worker.is_alive()
+    finally:
+        release.set()
+        worker.join()
+
+
+def test_concurrent_builds_keep_one_manager_and_close_the_other(monkeypatch):
+    barrier = threading.Barrier(2, timeout=5)
+    built = []
+
+    class RacingManager:
+        def __init__(self, db_path, user_id):
+            built.append(self)
+            self.close = MagicMock()
+            barrier.wait()
+
+    _patch_sqlite_manager(monkeypatch, RacingManager)
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(UserManagerFactory.create_sqlite(db_path="race.db"))
+        )
+        for _ in range(2)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(built) == 2
+    assert results[0] is results[1]
+    loser = next(manager for manager in built if manager is not results[0])
+    loser.close.assert_called_once()
+    results[0].close.assert_not_called()
+
+
+def test_refresh_env_cache_rereads_ports(monkeypatch):
+    monkeypatch.setenv("MYSQL_PORT", "3307")
+    monkeypatch.setenv("MOS_POSTGRES_PORT", "6543")
+    factory.refresh_env_cache()
+
+    assert factory._load_mysql_env_config("root")["port"] == 3307
+    assert factory._load_postgres_env_config("root")["port"] == 6543
+
+    monkeypatch.undo()
+    factory.refresh_env_cache()
+
+
+def test_unparsable_port_only_fails_when_loaded(monkeypatch):
+    monkeypatch.setenv("MYSQL_PORT", "tcp://10.0.0.5:3306")
+    factory.refresh_env_cache()
+
+    # SQLite does not read MYSQL_PORT, so it must keep working
+    assert UserManagerFactory.create_sqlite(db_path=":memory:") is not None
+    with pytest.raises(ValueError):
+        factory._load_mysql_env_config("root")
+
+    monkeypatch.undo()
+    factory.refresh_env_cache()
+
+
+def test_env_config_is_fresh_per_call(monkeypatch):
+    monkeypatch.setenv("MYSQL_HOST", "db")
+    factory.refresh_env_cache()
+
+    alice = factory._load_mysql_env_config("alice")
+    alice["host"] = "tampered"
+    bob = factory._load_mysql_env_config("bob")
+
+    assert bob == {**alice, "user_id": "bob", "host": "db"}
+    # One cached settings mapping serves every user_id
+    assert factory._mysql_env_settings.cache_info().currsize == 1
+
+    monkeypatch.undo()
+    factory.refresh_env_cache()
+
+
+def test_postgres_env_config_includes_pool_settings(monkeypatch):
+    monkeypatch.setenv("MOS_POSTGRES_POOL_PRE_PING", "false")
+    monkeypatch.setenv("MOS_POSTGRES_POOL_RECYCLE", "1800")
+    factory.refresh_env_cache()
+
+    config = factory._load_postgres_env_config("root")
+
+    assert config["pool_pre_ping"] is False
+    assert config["pool_recycle"] == 1800
+
+    monkeypatch.undo()
+    factory.refresh_env_cache()
+    assert factory._load_postgres_env_config("root")["pool_pre_ping"] is True
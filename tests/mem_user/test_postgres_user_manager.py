@@ -8,11 +8,17 @@ import subprocess
 import time
 import uuid
 
+from unittest.mock import MagicMock
+
 import pytest
 
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import DBAPIError, ProgrammingError, SQLAlchemyError
 
-from memos.mem_user.postgres_user_manager import PostgresUserManager
+from memos.mem_user.postgres_user_manager import (
+    PostgresUserManager,
+    _retry_on_disconnect,
+    _validate_schema,
+)
 from memos.mem_user.user_manager import UserRole
 
 
@@ -133,6 +139,100 @@ def postgres_manager():
             manager.close()
         if container_name is not None:
             _stop_container(container_name)
+        # The next container on the same port is a fresh database
+        PostgresUserManager.reset_schema_cache()
+
+
+@pytest.mark.parametrize("schema", ["memos", "_private", "MemOS_2"])
+def test_validate_schema_accepts_identifiers(schema):
+    assert _validate_schema(schema) == schema
+
+
+@pytest.mark.parametrize(
+    ("schema", "message"),
+    [
+        ("", "cannot be empty"),
+        ("2memos", "must start with a letter or underscore"),
+        ("memos-test", "may only contain letters, numbers, and underscores"),
+        ("memos\n", "may only contain letters, numbers, and underscores"),
+        ("mémos", "may only contain letters, numbers, and underscores"),
+    ],
+)
+def test_validate_schema_rejects_invalid_names(schema, message):
+    with pytest.raises(ValueError, match=message):
+        _validate_schema(schema)
+
+
+def _dbapi_error(connection_invalidated: bool) -> DBAPIError:
+    return DBAPIError(
+        "SELECT 1", {}, Exception("boom"), connection_invalidated=connection_invalidated
+    )
+
+
+def test_retry_on_disconnect_retries_invalidated_connection_once():
+    calls = []
+
+    @_retry_on_disconnect
+    def query(self):
+        calls.append(self)
+        if len(calls) == 1:
+            raise _dbapi_error(connection_invalidated=True)
+        return "ok"
+
+    assert query("manager") == "ok"
+    assert calls == ["manager", "manager"]
+
+
+def test_retry_on_disconnect_raises_other_errors():
+    calls = []
+
+    @_retry_on_disconnect
+    def query(self):
+        calls.append(self)
+        raise _dbapi_error(connection_invalidated=False)
+
+    with pytest.raises(DBAPIError):
+        query("manager")
+    assert len(calls) == 1
+
+
+def _manager_with_cached_schema(monkeypatch, probe_error=None):
+    manager = PostgresUserManager.__new__(PostgresUserManager)
+    manager.connection_url = "postgresql://localhost/memos_users"
+    manager.schema = "memos"
+    manager.engine = MagicMock()
+    connection = manager.engine.connect.return_value.__enter__.return_value
+    connection.execute.side_effect = probe_error
+    manager._create_schema = MagicMock()
+    monkeypatch.setattr(
+        PostgresUserManager, "_initialized_schemas", {(manager.connection_url, manager.schema)}
+    )
+    return manager
+
+
+def test_cached_schema_skips_ddl_when_tables_exist(monkeypatch):
+    manager = _manager_with_cached_schema(monkeypatch)
+
+    manager._ensure_schema()
+
+    manager._create_schema.assert_not_called()
+
+
+def test_cached_schema_is_recreated_when_tables_are_missing(monkeypatch):
+    missing = ProgrammingError("SELECT", {}, Exception('relation "users" does not exist'))
+    manager = _manager_with_cached_schema(monkeypatch, probe_error=missing)
+
+    manager._ensure_schema()
+
+    manager._create_schema.assert_called_once()
+
+
+def test_reset_schema_cache_forgets_initialized_schemas(monkeypatch):
+    monkeypatch.setattr(PostgresUserManager, "_initialized_schemas", {("url", "memos")})
+
+    PostgresUserManager.reset_schema_cache()
+
+    assert PostgresUserManager._initialized_schemas == set()
 
 
 @pytest.mark.integration